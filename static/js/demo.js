@@ -46,7 +46,12 @@ class QuantaRouteDemo {
         // Route segment highlighting
         this.currentHighlightedSegment = null;
         this.selectedInstructionIndex = -1;
-        
+
+        // Alternative routes response cache (LRU, most recent entry last)
+        this.alternativesCache = new Map();
+        this.alternativesCacheMaxEntries = 20;
+        this.alternativesCacheStats = { hits: 0, misses: 0 };
+
         this.init();
     }
 
@@ -782,6 +787,14 @@ class QuantaRouteDemo {
             });
         }
 
+        // Compare all transport modes button
+        const compareModesBtn = document.getElementById('compareModes');
+        if (compareModesBtn) {
+            compareModesBtn.addEventListener('click', () => {
+                this.compareProfiles();
+            });
+        }
+
         // Alternative routes toggle - clear previous routes when toggled
         const alternativesToggle = document.getElementById('alternativesToggle');
         const algorithmSelection = document.getElementById('algorithmSelection');
@@ -2914,6 +2927,130 @@ class QuantaRouteDemo {
         return `rgb(${newR}, ${newG}, ${newB})`;
     }
 
+    /**
+     * Compare all transport modes for the current start/end (and waypoints)
+     * One request per profile, to the same endpoint calculateRoute would use,
+     * all in flight at once so every mode's ETA arrives within a single
+     * request's latency.
+     */
+    async compareProfiles() {
+        if (!this.startMarker || !this.endMarker) {
+            this.showStatusMessage('Please set both start and destination points', 'error');
+            return;
+        }
+
+        const comparisonContainer = document.getElementById('modeComparison');
+        if (!comparisonContainer) return;
+
+        const startPos = this.startMarker.getLatLng();
+        const endPos = this.endMarker.getLatLng();
+        const validWaypoints = this.waypoints.filter(wp => wp !== null);
+        const profiles = Array.from(document.querySelectorAll('.mode-btn')).map(btn => btn.dataset.profile);
+
+        comparisonContainer.innerHTML = '<div class="mode-comparison-item unavailable">⏳ Comparing modes...</div>';
+        comparisonContainer.style.display = 'block';
+
+        // Same endpoint choice as calculateRoute: 2+ waypoints go through
+        // /routing/optimized (which may reorder stops), otherwise /routing
+        const useOptimized = validWaypoints.length >= 2;
+
+        const startTime = performance.now();
+        const results = await Promise.allSettled(profiles.map(async profile => {
+            let endpoint;
+            let routeData;
+            if (useOptimized) {
+                endpoint = 'routing/optimized';
+                routeData = {
+                    start: [startPos.lat, startPos.lng],
+                    end: [endPos.lat, endPos.lng],
+                    waypoints: [
+                        [startPos.lat, startPos.lng],
+                        ...validWaypoints.map(wp => [wp.lat, wp.lng]),
+                        [endPos.lat, endPos.lng]
+                    ],
+                    profile: profile
+                };
+            } else {
+                endpoint = 'routing';
+                routeData = {
+                    start: [startPos.lat, startPos.lng],
+                    end: [endPos.lat, endPos.lng],
+                    profile: profile,
+                    algorithm: 'quantaroute',
+                    alternatives: false
+                };
+                if (validWaypoints.length > 0) {
+                    routeData.waypoints = validWaypoints.map(wp => [wp.lat, wp.lng]);
+                }
+            }
+
+            const response = await this.apiCall(endpoint, {
+                method: 'POST',
+                body: JSON.stringify(routeData)
+            });
+            if (!response.ok) {
+                throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+            }
+
+            const result = await response.json();
+
+            // Optimized responses carry one trip per segment; totals are their sum
+            if (useOptimized && result.trips && result.trips.length > 0) {
+                const totalDistance = result.trips.reduce((sum, trip) => sum + (trip.distance || 0), 0);
+                const totalDuration = result.trips.reduce((sum, trip) => sum + (trip.duration || 0), 0);
+                return {
+                    distance_km: totalDistance / 1000,
+                    duration_min: totalDuration / 60
+                };
+            }
+
+            const route = result.route || result;
+            return {
+                distance_km: route.distance / 1000,
+                duration_min: route.duration / 60
+            };
+        }));
+
+        this.log(`⚖️ Compared ${profiles.length} modes in ${(performance.now() - startTime).toFixed(0)}ms`);
+
+        const comparisons = profiles.map((profile, index) => ({
+            profile,
+            route: results[index].status === 'fulfilled' ? results[index].value : null
+        }));
+        const available = comparisons.filter(c => c.route && Number.isFinite(c.route.duration_min));
+        const fastest = available.reduce(
+            (best, c) => (!best || c.route.duration_min < best.route.duration_min ? c : best),
+            null
+        );
+
+        comparisonContainer.innerHTML = '';
+        comparisons.forEach(comparison => {
+            const profileConfig = this.getProfileConfig(comparison.profile);
+            const hasRoute = available.includes(comparison);
+
+            const item = document.createElement('div');
+            item.className = `mode-comparison-item${comparison === fastest ? ' fastest' : ''}${hasRoute ? '' : ' unavailable'}`;
+            item.innerHTML = `
+                <span>${profileConfig.icon}</span>
+                <span class="mode-comparison-name">${profileConfig.name}</span>
+                ${hasRoute ? `
+                <span class="mode-comparison-distance">${comparison.route.distance_km.toFixed(1)} km</span>
+                <strong>${this.formatDuration(comparison.route.duration_min)}</strong>` : `
+                <span class="mode-comparison-distance">No route</span>`}
+            `;
+
+            // Click a mode to switch to it
+            if (hasRoute) {
+                item.addEventListener('click', () => {
+                    const modeBtn = document.querySelector(`.mode-btn[data-profile="${comparison.profile}"]`);
+                    if (modeBtn) modeBtn.click();
+                });
+            }
+
+            comparisonContainer.appendChild(item);
+        });
+    }
+
     /**
      * Calculate optimized route using TSP + QuantaRoute for multi-point routing
      * Endpoint: /v1/routing/optimized
@@ -3213,49 +3350,38 @@ class QuantaRouteDemo {
                     );
                 }
 
+                // Waypoint routes: compute alternatives per leg and combine them
+                if (routeData.waypoints && routeData.waypoints.length > 0) {
+                    return await this.calculateMultiLegAlternatives(routeData);
+                }
+
                 console.log('📤 Sending request to /routing/alternatives with data:', routeData);
                 console.log('🔍 REQUEST SUMMARY:');
                 console.log('   Endpoint:', `${this.apiBaseUrl}/routing/alternatives`);
                 console.log('   Start:', routeData.start);
                 console.log('   End:', routeData.end);
-                console.log('   Waypoints:', routeData.waypoints || 'none');
                 console.log('   Profile:', routeData.profile);
                 console.log('   Method:', routeData.method);
-                
+
                 this.log('🛣️ Calculating alternative routes');
-                
-                const response = await this.apiCall('routing/alternatives', {
-                    method: 'POST',
-                    body: JSON.stringify(routeData)
-                });
 
-                if (!response.ok) {
-                    const errorText = await response.text();
-                    console.error('Alternative routes API error:', errorText);
-                    
+                let result;
+                try {
+                    result = await this.fetchAlternativeRoutes(routeData);
+                } catch (error) {
                     // Handle no route found errors specially
-                    if (response.status === 404) {
-                        let errorData;
-                        try {
-                            errorData = JSON.parse(errorText);
-                        } catch {
-                            errorData = { detail: errorText };
-                        }
-                        
+                    if (error.status === 404) {
                         this.showStatusMessage(
-                            `${errorData.detail || 'No route found for this transport mode.'}`, 
+                            `${error.detail || 'No route found for this transport mode.'}`, 
                             'error'
                         );
                         return; // Don't throw, just show the message and return
                     }
-                    
-                    throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+                    throw error;
                 }
-
-                const result = await response.json();
                 console.log('📥 API Response from /routing/alternatives:', result);
                 
-                // Analyze response for waypoint processing
+                // Analyze response
                 console.log('🔍 RESPONSE ANALYSIS:');
                 const optimalRoute = result.optimal_route || result.route;
                 if (optimalRoute) {
@@ -3263,23 +3389,7 @@ class QuantaRouteDemo {
                     console.log('   Route path points:', pathLength);
                     console.log('   Distance:', optimalRoute.distance || optimalRoute.distance_km, 'km');
                     console.log('   Duration:', optimalRoute.duration || optimalRoute.duration_min, 'min');
-                    
-                    // Check if waypoints are mentioned in instructions
-                    const instructions = optimalRoute.instructions || [];
-                    const waypointInstructions = instructions.filter(i => 
-                        i.instruction?.toLowerCase().includes('waypoint') || 
-                        i.instruction?.toLowerCase().includes('via')
-                    );
-                    console.log('   Instructions:', instructions.length, 'steps');
-                    console.log('   Waypoint-related instructions:', waypointInstructions.length);
-                    
-                    if (waypointInstructions.length > 0) {
-                        console.log('   ✅ Backend processed waypoints! Found waypoint instructions:');
-                        waypointInstructions.forEach(i => console.log('      -', i.instruction));
-                    } else if (routeData.waypoints && routeData.waypoints.length > 0) {
-                        console.warn('   ⚠️ Waypoints were sent but not reflected in instructions');
-                        console.warn('   ⚠️ Backend may not support waypoints on this endpoint');
-                    }
+                    console.log('   Instructions:', (optimalRoute.instructions || []).length, 'steps');
                 } else {
                     console.error('   ❌ No route found in response');
                 }
@@ -3420,6 +3530,294 @@ class QuantaRouteDemo {
         }
     }
 
+    /**
+     * Calculate alternative routes through waypoints leg by leg
+     * Every leg (start→wp1, ..., wpN→end) is requested from /v1/routing/alternatives
+     * in parallel, then leg options are combined into full-route candidates ranked
+     * by total duration, with candidates too similar to a better one pruned.
+     */
+    async calculateMultiLegAlternatives(routeData) {
+        const points = [routeData.start, ...routeData.waypoints, routeData.end];
+        const legRequests = [];
+        for (let i = 0; i < points.length - 1; i++) {
+            legRequests.push({
+                start: points[i],
+                end: points[i + 1],
+                profile: routeData.profile,
+                method: routeData.method,
+                num_alternatives: routeData.num_alternatives,
+                diversity_preference: routeData.diversity_preference
+            });
+        }
+
+        console.log(`📤 Requesting alternatives for ${legRequests.length} legs in parallel`);
+        const startTime = performance.now();
+
+        let legResults;
+        try {
+            legResults = await Promise.all(legRequests.map(legData => this.fetchAlternativeRoutes(legData)));
+        } catch (error) {
+            // Handle no route found errors specially
+            if (error.status === 404) {
+                this.showStatusMessage(
+                    `${error.detail || 'No route found for this transport mode.'}`,
+                    'error'
+                );
+                return;
+            }
+            throw error;
+        }
+
+        const legOptions = legResults.map(result => this.getLegRouteOptions(result));
+        const missingLeg = legOptions.findIndex(options => options.length === 0);
+        if (missingLeg !== -1) {
+            console.error(`   ❌ No route found for leg ${missingLeg + 1}`);
+            this.showStatusMessage(`No route found for leg ${missingLeg + 1} of the trip`, 'error');
+            return;
+        }
+
+        const combinations = this.combineLegAlternatives(
+            legOptions,
+            routeData.num_alternatives + 1,
+            routeData.diversity_preference
+        );
+        console.log(`✅ Combined ${legOptions.map(o => o.length).join('×')} leg options into ${combinations.length} routes`);
+
+        const buildRoute = (combination) => {
+            const coordinates = [];
+            const instructions = [];
+            const elevationProfile = [];
+            let distance = 0;
+            let duration = 0;
+
+            combination.choices.forEach((choice, legIndex) => {
+                const option = legOptions[legIndex][choice];
+
+                // Skip first point of subsequent legs (it's the same as last point of previous)
+                coordinates.push(...(legIndex > 0 ? option.coordinates.slice(1) : option.coordinates));
+
+                if (legIndex > 0) {
+                    instructions.push({
+                        instruction: `🎯 Waypoint ${legIndex} reached - Continue to next stop`,
+                        distance: 0,
+                        duration: 0,
+                        name: `Waypoint ${legIndex}`,
+                        maneuver: { type: 'waypoint' }
+                    });
+                }
+                instructions.push(...option.instructions);
+                elevationProfile.push(...option.elevation_profile);
+
+                distance += option.distance;
+                duration += option.duration;
+            });
+
+            return {
+                geometry: { type: 'LineString', coordinates },
+                distance,
+                duration,
+                instructions,
+                elevation_profile: elevationProfile,
+                elevation_stats: null
+            };
+        };
+
+        const optimalRoute = buildRoute(combinations[0]);
+        const combinedResult = {
+            optimal_route: {
+                ...optimalRoute,
+                algorithm: legResults[0].optimal_route?.algorithm
+            },
+            alternative_routes: combinations.slice(1).map((combination, index) => {
+                const route = buildRoute(combination);
+                return {
+                    ...route,
+                    route_name: `🔀 Alternative ${index + 1}`,
+                    route_description: `Combines per-leg alternatives through ${routeData.waypoints.length} waypoint${routeData.waypoints.length > 1 ? 's' : ''}`,
+                    cost_ratio: optimalRoute.duration > 0 ? route.duration / optimalRoute.duration : 1.0,
+                    similarity_to_optimal: combination.similarity_to_optimal
+                };
+            }),
+            computation_method: legResults[0].computation_method,
+            total_compute_time_ms: performance.now() - startTime
+        };
+
+        this.log('✅ Multi-leg alternative routes calculated');
+        this.displayAlternativeRoutesResponse(combinedResult);
+    }
+
+    /**
+     * Request alternative routes for one origin/destination pair (cache-aware)
+     * Throws an Error carrying `status` and `detail` when the API call fails
+     */
+    async fetchAlternativeRoutes(routeData) {
+        const cacheKey = this.getAlternativesCacheKey(routeData);
+        const cachedResult = this.getCachedAlternatives(cacheKey);
+        if (cachedResult) {
+            this.log('💾 Alternative routes served from cache', this.getAlternativesCacheStats());
+            return cachedResult;
+        }
+
+        const response = await this.apiCall('routing/alternatives', {
+            method: 'POST',
+            body: JSON.stringify(routeData)
+        });
+
+        if (!response.ok) {
+            const errorText = await response.text();
+            console.error('Alternative routes API error:', errorText);
+
+            let errorData;
+            try {
+                errorData = JSON.parse(errorText);
+            } catch {
+                errorData = { detail: errorText };
+            }
+
+            const error = new Error(`HTTP ${response.status}: ${response.statusText}`);
+            error.status = response.status;
+            error.detail = errorData.detail;
+            throw error;
+        }
+
+        const result = await response.json();
+        this.cacheAlternatives(cacheKey, result);
+        return result;
+    }
+
+    /**
+     * Flatten one alternatives response into route options (optimal first)
+     */
+    getLegRouteOptions(data) {
+        const toOption = (route) => {
+            let geometry = route.geometry || route.route?.geometry;
+            if (geometry && geometry.geometry) {
+                geometry = geometry.geometry;
+            }
+
+            return {
+                coordinates: geometry?.coordinates || [],
+                distance: route.distance || route.route?.distance || 0,
+                duration: route.duration || route.route?.duration || 0,
+                similarity_to_optimal: route.similarity_to_optimal,
+                instructions: route.instructions || [],
+                elevation_profile: route.elevation_profile || route.route?.elevation_profile || []
+            };
+        };
+
+        const options = [];
+        if (data.optimal_route) {
+            options.push({ ...toOption(data.optimal_route), similarity_to_optimal: 1.0 });
+            (data.alternative_routes || []).forEach(alt => options.push(toOption(alt)));
+        }
+        return options;
+    }
+
+    /**
+     * Combine per-leg route options into at most `numRoutes` full routes
+     * Partial combinations are expanded leg by leg keeping only the cheapest
+     * (beam search), so the work stays bounded as waypoints are added. A
+     * candidate is dropped when it shares too much distance with a cheaper one.
+     */
+    combineLegAlternatives(legOptions, numRoutes, diversityPreference) {
+        const beamWidth = numRoutes * 4;
+        let candidates = [{ choices: [], duration: 0 }];
+
+        legOptions.forEach(options => {
+            const expanded = [];
+            candidates.forEach(candidate => {
+                options.forEach((option, optionIndex) => {
+                    expanded.push({
+                        choices: [...candidate.choices, optionIndex],
+                        duration: candidate.duration + option.duration
+                    });
+                });
+            });
+            expanded.sort((a, b) => a.duration - b.duration);
+            candidates = expanded.slice(0, beamWidth);
+        });
+
+        // Per-leg similarity: identical option = 1, optimal vs alternative uses the
+        // backend's similarity_to_optimal, two alternatives are compared by the
+        // geometry they share
+        const sharedCache = new Map();
+        const legSimilarity = (legIndex, a, b) => {
+            if (a === b) return 1;
+            const options = legOptions[legIndex];
+            const alternative = a === 0 ? options[b] : b === 0 ? options[a] : null;
+            if (alternative && alternative.similarity_to_optimal != null) {
+                return alternative.similarity_to_optimal;
+            }
+
+            const cacheKey = `${legIndex}:${Math.min(a, b)}:${Math.max(a, b)}`;
+            if (!sharedCache.has(cacheKey)) {
+                sharedCache.set(cacheKey, this.calculateRouteSharing(options[a], options[b]));
+            }
+            return sharedCache.get(cacheKey);
+        };
+
+        // Distance-weighted similarity of candidate `a` to candidate `b`
+        const similarity = (a, b) => {
+            let shared = 0;
+            let total = 0;
+            a.choices.forEach((choice, legIndex) => {
+                const distance = legOptions[legIndex][choice].distance;
+                total += distance;
+                shared += distance * legSimilarity(legIndex, choice, b.choices[legIndex]);
+            });
+            return total > 0 ? shared / total : 1;
+        };
+
+        const maxSimilarity = 1 - diversityPreference / 2;
+        const selected = [];
+        for (const candidate of candidates) {
+            if (selected.length >= numRoutes) break;
+            if (selected.every(chosen => similarity(candidate, chosen) <= maxSimilarity)) {
+                selected.push(candidate);
+            }
+        }
+
+        return selected.map(candidate => ({
+            ...candidate,
+            similarity_to_optimal: similarity(candidate, selected[0])
+        }));
+    }
+
+    /**
+     * Shared length of two route options as a fraction of the shorter one
+     * Segments are matched by their rounded [lon, lat] endpoints in either direction.
+     */
+    calculateRouteSharing(optionA, optionB) {
+        const segmentLengths = (option) => {
+            if (!option.segmentLengths) {
+                option.segmentLengths = new Map();
+                const coords = option.coordinates;
+                for (let i = 1; i < coords.length; i++) {
+                    const from = `${coords[i - 1][0].toFixed(6)},${coords[i - 1][1].toFixed(6)}`;
+                    const to = `${coords[i][0].toFixed(6)},${coords[i][1].toFixed(6)}`;
+                    if (from === to) continue;
+                    const key = from < to ? `${from};${to}` : `${to};${from}`;
+                    option.segmentLengths.set(key, this.haversineDistance(
+                        coords[i - 1][1], coords[i - 1][0], coords[i][1], coords[i][0]
+                    ));
+                }
+            }
+            return option.segmentLengths;
+        };
+
+        const segmentsA = segmentLengths(optionA);
+        const segmentsB = segmentLengths(optionB);
+        const totalLength = (segments) => Array.from(segments.values()).reduce((sum, length) => sum + length, 0);
+        const shorter = Math.min(totalLength(segmentsA), totalLength(segmentsB));
+        if (shorter <= 0) return 0;
+
+        let shared = 0;
+        segmentsA.forEach((length, key) => {
+            if (segmentsB.has(key)) shared += length;
+        });
+        return Math.min(1, shared / shorter);
+    }
+
     /**
      * Extract and convert GeoJSON geometry to Leaflet [lat, lng] path format
      * Handles both GeoJSON Feature and Geometry objects
@@ -3473,6 +3871,69 @@ class QuantaRouteDemo {
         return [];
     }
 
+    /**
+     * Build the cache key for an alternative routes request
+     * Coordinates are rounded to 5 decimals (~1m) so points that snap to the
+     * same road node share an entry; the API base URL keeps local and remote
+     * results apart.
+     */
+    getAlternativesCacheKey(routeData) {
+        const roundPoint = (point) => point.map(value => value.toFixed(5)).join(',');
+        return [
+            this.apiBaseUrl,
+            roundPoint(routeData.start),
+            roundPoint(routeData.end),
+            (routeData.waypoints || []).map(roundPoint).join(';'),
+            routeData.profile,
+            routeData.method,
+            routeData.num_alternatives,
+            routeData.diversity_preference
+        ].join('|');
+    }
+
+    /**
+     * Look up a cached alternative routes response and mark it most recently used
+     */
+    getCachedAlternatives(cacheKey) {
+        if (!this.alternativesCache.has(cacheKey)) {
+            this.alternativesCacheStats.misses++;
+            return null;
+        }
+
+        const result = this.alternativesCache.get(cacheKey);
+        this.alternativesCache.delete(cacheKey);
+        this.alternativesCache.set(cacheKey, result);
+        this.alternativesCacheStats.hits++;
+        return result;
+    }
+
+    /**
+     * Store an alternative routes response, evicting the least recently used entry
+     */
+    cacheAlternatives(cacheKey, result) {
+        this.alternativesCache.delete(cacheKey);
+        this.alternativesCache.set(cacheKey, result);
+
+        if (this.alternativesCache.size > this.alternativesCacheMaxEntries) {
+            const oldestKey = this.alternativesCache.keys().next().value;
+            this.alternativesCache.delete(oldestKey);
+        }
+    }
+
+    /**
+     * Alternative routes cache statistics (hits, misses, hit rate, entries)
+     */
+    getAlternativesCacheStats() {
+        const { hits, misses } = this.alternativesCacheStats;
+        const lookups = hits + misses;
+        return {
+            hits,
+            misses,
+            hit_rate: lookups > 0 ? hits / lookups : 0,
+            entries: this.alternativesCache.size
+        };
+    }
+
     displayAlternativeRoutesResponse(data) {
         // Handle the new alternative routes API response format
         this.log('🎨 Displaying alternative routes');
@@ -4062,7 +4523,11 @@ class QuantaRouteDemo {
         // Hide alternative routes UI
         const alternativeRoutes = document.getElementById('alternativeRoutes');
         if (alternativeRoutes) alternativeRoutes.style.display = 'none';
-        
+
+        // Hide mode comparison
+        const modeComparison = document.getElementById('modeComparison');
+        if (modeComparison) modeComparison.style.display = 'none';
+
         // Hide elevation profile overlay
         this.hideElevationProfile();
         
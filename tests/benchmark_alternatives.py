@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+Alternative Routes Quality & Latency Benchmark
+Runs every alternative_routes method over seeded OD pairs in distance buckets
+and writes a JSON summary that can be diffed between commits.
+
+Usage:
+    python tests/benchmark_alternatives.py --pairs-per-bucket 50 --output before.json
+    python tests/benchmark_alternatives.py --methods adaptive plateau --seed 7
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+import json
+import math
+import random
+import time
+from itertools import combinations
+
+from quantaroute import QuantaRoute
+
+DEFAULT_METHODS = ['adaptive', 'fast', 'perturbation', 'highway', 'major', 'plateau']
+
+# Great-circle distance buckets (km): (name, min, max)
+DISTANCE_BUCKETS = [
+    ('0-2km', 0.5, 2.0),
+    ('2-5km', 2.0, 5.0),
+    ('5-10km', 5.0, 10.0),
+    ('10-20km', 10.0, 20.0),
+    ('20km+', 20.0, 60.0),
+]
+
+# Singapore bounding box (south, west, north, east) matching the default PBF
+SINGAPORE_BBOX = (1.24, 103.62, 1.47, 104.00)
+
+# Local optimality test: subpath window as a fraction of the alternative's
+# length, and the tolerance over the shortest path between its endpoints
+LOCAL_OPT_WINDOW = 0.25
+LOCAL_OPT_TOLERANCE = 0.10
+
+
+def haversine_km(lat1, lng1, lat2, lng2):
+    """Great-circle distance between two points in km"""
+    r = 6371.0
+    d_lat = math.radians(lat2 - lat1)
+    d_lng = math.radians(lng2 - lng1)
+    a = (math.sin(d_lat / 2) ** 2 +
+         math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(d_lng / 2) ** 2)
+    return r * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+
+def percentile(values, pct):
+    """Linearly interpolated percentile (pct in 0-100), None for no values"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    if lower == upper:
+        return ordered[lower]
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def mean(values):
+    return sum(values) / len(values) if values else None
+
+
+def is_routable(router, start, end, profile):
+    """Probe route between two points; False if snapping or routing fails"""
+    try:
+        return router.route(start=start, end=end, profile=profile) is not None
+    except Exception:
+        return False
+
+
+def generate_od_pairs(router, bbox, pairs_per_bucket, seed, profile):
+    """Rejection-sample seeded OD pairs until every distance bucket is full
+
+    Pairs that cannot be routed (sea, points across the border, unreachable
+    areas) are dropped, so every method runs on the same routable pairs.
+    Returns the pairs per bucket and the number of unroutable pairs dropped.
+    """
+    rng = random.Random(seed)
+    south, west, north, east = bbox
+    pairs = {name: [] for name, _, _ in DISTANCE_BUCKETS}
+    dropped = 0
+
+    max_attempts = pairs_per_bucket * len(DISTANCE_BUCKETS) * 1000
+    for _ in range(max_attempts):
+        if all(len(bucket) >= pairs_per_bucket for bucket in pairs.values()):
+            break
+        start = (rng.uniform(south, north), rng.uniform(west, east))
+        end = (rng.uniform(south, north), rng.uniform(west, east))
+        distance = haversine_km(start[0], start[1], end[0], end[1])
+        for name, low, high in DISTANCE_BUCKETS:
+            if low <= distance < high and len(pairs[name]) < pairs_per_bucket:
+                if is_routable(router, start, end, profile):
+                    pairs[name].append((start, end))
+                else:
+                    dropped += 1
+                break
+
+    return pairs, dropped
+
+
+def route_coordinates(route):
+    """Route geometry as [(lat, lng), ...] from the route's GeoJSON, or None"""
+    geojson = getattr(route, 'geojson', None)
+    if not geojson:
+        return None
+    coords = geojson.get('geometry', {}).get('coordinates', [])
+    if len(coords) < 2:
+        return None
+    return [(lat, lng) for lng, lat in coords]
+
+
+def route_segments(coords):
+    """Undirected segments keyed by rounded endpoints, with their lengths in km"""
+    segments = {}
+    for (lat1, lng1), (lat2, lng2) in zip(coords, coords[1:]):
+        a = (round(lat1, 6), round(lng1, 6))
+        b = (round(lat2, 6), round(lng2, 6))
+        if a == b:
+            continue
+        segments[(min(a, b), max(a, b))] = haversine_km(lat1, lng1, lat2, lng2)
+    return segments
+
+
+def sharing(coords_a, coords_b):
+    """Shared length of two routes as a fraction of the shorter one"""
+    segments_a = route_segments(coords_a)
+    segments_b = route_segments(coords_b)
+    shorter = min(sum(segments_a.values()), sum(segments_b.values()))
+    if shorter <= 0:
+        return None
+    shared = sum(length for key, length in segments_a.items() if key in segments_b)
+    return min(1.0, shared / shorter)
+
+
+def subpath_window(coords, fraction):
+    """Endpoints and length of the subpath covering the centre `fraction` of the route
+
+    The window is widened outwards to the enclosing vertices, so it always
+    contains the requested span. Returns None for a degenerate window.
+    """
+    cumulative = [0.0]
+    for (lat1, lng1), (lat2, lng2) in zip(coords, coords[1:]):
+        cumulative.append(cumulative[-1] + haversine_km(lat1, lng1, lat2, lng2))
+    total = cumulative[-1]
+    lo = total * (0.5 - fraction / 2)
+    hi = total * (0.5 + fraction / 2)
+    i = max(idx for idx, d in enumerate(cumulative) if d <= lo)
+    j = min(idx for idx, d in enumerate(cumulative) if d >= hi)
+    subpath_km = cumulative[j] - cumulative[i]
+    if j <= i or subpath_km <= 0:
+        return None
+    return coords[i], coords[j], subpath_km
+
+
+def is_locally_optimal(router, coords, profile):
+    """T-test: the centre subpath must be within tolerance of the shortest path
+
+    Returns 'pass' or 'fail', 'skipped' for a degenerate window, or 'error'
+    when the shortest path between the window ends cannot be computed.
+    """
+    window = subpath_window(coords, LOCAL_OPT_WINDOW)
+    if window is None:
+        return 'skipped'
+    u, w, subpath_km = window
+    try:
+        shortest = router.route(start=u, end=w, profile=profile)
+    except Exception:
+        return 'error'
+    if shortest is None:
+        return 'error'
+    if subpath_km <= shortest.distance_km * (1 + LOCAL_OPT_TOLERANCE):
+        return 'pass'
+    return 'fail'
+
+
+def benchmark_pair(router, method, start, end, args):
+    """Run one method on one OD pair and collect its metrics"""
+    t0 = time.perf_counter()
+    alt_routes = router.alternative_routes(
+        start=start,
+        end=end,
+        num_alternatives=args.num_alternatives,
+        method=method,
+        profile=args.profile,
+        diversity_preference=args.diversity_preference
+    )
+    latency_ms = (time.perf_counter() - t0) * 1000
+
+    optimal = alt_routes.optimal_route
+    alternatives = [alt.route for alt in alt_routes.alternative_routes]
+
+    stretches = [
+        route.duration_min / optimal.duration_min
+        for route in alternatives if optimal.duration_min > 0
+    ]
+
+    all_coords = [route_coordinates(r) for r in [optimal] + alternatives]
+    pair_sharing = []
+    for a, b in combinations([c for c in all_coords if c], 2):
+        value = sharing(a, b)
+        if value is not None:
+            pair_sharing.append(value)
+
+    # Only completed tests count towards the rate; skipped/failed checks are
+    # reported separately so they never pass as locally optimal
+    local_optimal = []
+    local_opt_skipped = 0
+    local_opt_errors = 0
+    if args.local_optimality:
+        for coords in all_coords[1:]:
+            if not coords:
+                continue
+            outcome = is_locally_optimal(router, coords, args.profile)
+            if outcome == 'skipped':
+                local_opt_skipped += 1
+            elif outcome == 'error':
+                local_opt_errors += 1
+            else:
+                local_optimal.append(outcome == 'pass')
+
+    return {
+        'latency_ms': latency_ms,
+        'routes_found': alt_routes.total_routes,
+        'computation_method': alt_routes.computation_method,
+        'stretch': stretches,
+        'sharing': pair_sharing,
+        'local_optimal': local_optimal,
+        'local_optimality_skipped': local_opt_skipped,
+        'local_optimality_errors': local_opt_errors,
+    }
+
+
+def summarize(samples):
+    """Aggregate per-pair samples into the JSON summary for one method/bucket"""
+    ok = [s for s in samples if 'error' not in s]
+    latencies = [s['latency_ms'] for s in ok]
+    stretches = [x for s in ok for x in s['stretch']]
+    sharings = [x for s in ok for x in s['sharing']]
+    local_opt = [x for s in ok for x in s['local_optimal']]
+
+    def rounded(value, digits=3):
+        return None if value is None else round(value, digits)
+
+    return {
+        'pairs': len(samples),
+        'errors': len(samples) - len(ok),
+        'latency_ms': {
+            'p50': rounded(percentile(latencies, 50), 1),
+            'p90': rounded(percentile(latencies, 90), 1),
+            'p95': rounded(percentile(latencies, 95), 1),
+            'p99': rounded(percentile(latencies, 99), 1),
+            'mean': rounded(mean(latencies), 1),
+        },
+        'routes_found': {
+            'mean': rounded(mean([s['routes_found'] for s in ok])),
+            'with_alternatives': rounded(mean([1.0 if s['routes_found'] > 1 else 0.0 for s in ok])),
+        },
+        'stretch': {
+            'mean': rounded(mean(stretches)),
+            'p95': rounded(percentile(stretches, 95)),
+            'max': rounded(max(stretches) if stretches else None),
+        },
+        'pairwise_sharing': {
+            'mean': rounded(mean(sharings)),
+            'max': rounded(max(sharings) if sharings else None),
+        },
+        'local_optimality_rate': rounded(mean([1.0 if x else 0.0 for x in local_opt])),
+        'local_optimality_tested': len(local_opt),
+        'local_optimality_skipped': sum(s['local_optimality_skipped'] for s in ok),
+        'local_optimality_errors': sum(s['local_optimality_errors'] for s in ok),
+        'computation_methods': sorted({s['computation_method'] for s in ok}),
+    }
+
+
+def run_benchmark(args):
+    """Benchmark every requested method and return the JSON-ready report"""
+    print("🚀 ALTERNATIVE ROUTES BENCHMARK")
+    print("=" * 65)
+
+    print(f"🏗️ Loading QuantaRoute ({args.pbf}, {args.profile})...")
+    router = QuantaRoute.from_pbf(args.pbf, args.profile)
+    print("✅ QuantaRoute loaded successfully!")
+
+    od_pairs, dropped_pairs = generate_od_pairs(
+        router, args.bbox, args.pairs_per_bucket, args.seed, args.profile
+    )
+    total_pairs = sum(len(p) for p in od_pairs.values())
+    print(f"📍 {total_pairs} routable OD pairs (seed {args.seed}) in {len(od_pairs)} distance buckets")
+    print(f"   Dropped {dropped_pairs} unroutable pairs while sampling")
+
+    report = {
+        'config': {
+            'pbf': args.pbf,
+            'profile': args.profile,
+            'seed': args.seed,
+            'bbox': list(args.bbox),
+            'pairs_per_bucket': args.pairs_per_bucket,
+            'pairs_sampled': {name: len(pairs) for name, pairs in od_pairs.items()},
+            'unroutable_pairs_dropped': dropped_pairs,
+            'num_alternatives': args.num_alternatives,
+            'diversity_preference': args.diversity_preference,
+            'local_optimality': args.local_optimality,
+            'local_optimality_window': LOCAL_OPT_WINDOW,
+            'local_optimality_tolerance': LOCAL_OPT_TOLERANCE,
+        },
+        'methods': {},
+    }
+
+    for method in args.methods:
+        print(f"\n🔄 Method: {method}")
+        print("-" * 50)
+
+        # Warm-up call so one-off initialisation is not counted as latency
+        first_bucket = next((p for p in od_pairs.values() if p), [])
+        if first_bucket:
+            try:
+                start, end = first_bucket[0]
+                router.alternative_routes(start=start, end=end, method=method,
+                                          num_alternatives=args.num_alternatives,
+                                          profile=args.profile,
+                                          diversity_preference=args.diversity_preference)
+            except Exception:
+                pass
+
+        all_samples = []
+        buckets = {}
+        for bucket_name, pairs in od_pairs.items():
+            samples = []
+            for start, end in pairs:
+                try:
+                    samples.append(benchmark_pair(router, method, start, end, args))
+                except Exception as e:
+                    samples.append({'error': str(e)})
+            buckets[bucket_name] = summarize(samples)
+            all_samples.extend(samples)
+
+            latency = buckets[bucket_name]['latency_ms']
+            p50 = f"{latency['p50']:.1f}ms" if latency['p50'] is not None else 'n/a'
+            p95 = f"{latency['p95']:.1f}ms" if latency['p95'] is not None else 'n/a'
+            print(f"   {bucket_name:8} | {len(samples):3} pairs | "
+                  f"{buckets[bucket_name]['errors']:3} errors | p50 {p50} | p95 {p95}")
+
+        report['methods'][method] = {
+            'overall': summarize(all_samples),
+            'buckets': buckets,
+        }
+
+    # Summary
+    print("\n" + "=" * 65)
+    print("📊 BENCHMARK SUMMARY:")
+    print("=" * 65)
+    for method, result in report['methods'].items():
+        overall = result['overall']
+        print(f"{method:14} | p50 {overall['latency_ms']['p50']}ms | "
+              f"p95 {overall['latency_ms']['p95']}ms | "
+              f"routes {overall['routes_found']['mean']} | "
+              f"stretch {overall['stretch']['mean']} | "
+              f"sharing {overall['pairwise_sharing']['mean']} | "
+              f"local-opt {overall['local_optimality_rate']}")
+
+    return report
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark alternative route methods')
+    parser.add_argument('--pbf', default='../test-data/sg-220825.osm.pbf',
+                        help='OSM PBF file to load')
+    parser.add_argument('--profile', default='car')
+    parser.add_argument('--methods', nargs='+', default=DEFAULT_METHODS)
+    parser.add_argument('--bbox', nargs=4, type=float, default=SINGAPORE_BBOX,
+                        metavar=('SOUTH', 'WEST', 'NORTH', 'EAST'),
+                        help='area to sample OD pairs from')
+    parser.add_argument('--pairs-per-bucket', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--num-alternatives', type=int, default=3)
+    parser.add_argument('--diversity-preference', type=float, default=0.7)
+    parser.add_argument('--skip-local-optimality', dest='local_optimality',
+                        action='store_false',
+                        help='skip the local optimality test (one extra route per alternative)')
+    parser.add_argument('--output', default='alternatives_benchmark.json',
+                        help='JSON report path')
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    report = run_benchmark(args)
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write('\n')
+    print(f"\n💾 Report written to {args.output}")